@@ -10,7 +10,13 @@ from homeassistant.loader import async_get_loaded_integration
 
 from .api import CenturionGarageApiClient
 import logging
-from .const import DOMAIN, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_IP_ADDRESS,
+    CONF_MAC,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+)
 from .coordinator import CenturionGarageDataUpdateCoordinator
 from .data import CenturionGarageRuntimeData
 
@@ -26,6 +32,16 @@ PLATFORMS: list[Platform] = [
 ]
 
 
+def _entry_settings(entry: ConfigEntry) -> dict:
+    """Return the entry settings whose change requires a reload."""
+    data = {
+        key: value
+        for key, value in entry.data.items()
+        if key not in (CONF_IP_ADDRESS, CONF_MAC)
+    }
+    return {**data, **entry.options}
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Centurion Garage Door integration using UI."""
     # Ensure DOMAIN and entry_id are initialized in hass.data
@@ -43,22 +59,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         scan_interval = DEFAULT_SCAN_INTERVAL
     coordinator = CenturionGarageDataUpdateCoordinator(
         hass=hass,
+        config_entry=entry,
         api_client=CenturionGarageApiClient(
             ip_address=entry.data.get("ip_address", ""),
             api_key=entry.data.get("api_key", ""),
             session=async_get_clientsession(hass),
         ),
         logger=logging.getLogger(__name__),
-        name=DOMAIN,
         update_interval=timedelta(seconds=scan_interval),
     )
     hass.data[DOMAIN][entry.entry_id] = CenturionGarageRuntimeData(
         client=coordinator.api_client,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
+        settings=_entry_settings(entry),
     )
     entry.runtime_data = hass.data[DOMAIN][entry.entry_id]
     await coordinator.async_config_entry_first_refresh()
+    await coordinator.async_backfill_mac()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     return True
@@ -70,5 +88,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Reload config entry."""
+    """Reload config entry, unless only the rebound IP address or MAC changed."""
+    runtime_data = hass.data[DOMAIN].get(entry.entry_id)
+    if runtime_data is not None and runtime_data.settings == _entry_settings(entry):
+        return
     await hass.config_entries.async_reload(entry.entry_id)
@@ -1,7 +1,26 @@
 """Sample API Client for Centurion Garage Door."""
 
+import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import UTC, datetime
+from typing import Any
+
 import aiohttp
 import async_timeout
+from homeassistant.util.json import json_loads
+
+from .const import (
+    CAMERA_PORT,
+    RESPONSE_MAX_BYTES,
+    SNAPSHOT_MAX_BYTES,
+    STATUS_FIELDS,
+    STREAM_READ_TIMEOUT,
+)
+from .data import CenturionGarageMetrics
+from .scheduler import CenturionGarageRequestScheduler, RequestPriority
+from .stream import CenturionGarageMjpegRelay
 
 
 class CenturionGarageApiClientError(Exception):
@@ -16,6 +35,10 @@ class CenturionGarageApiClientAuthenticationError(CenturionGarageApiClientError)
     """Exception for authentication errors with Centurion Garage API client."""
 
 
+class CenturionGarageApiClientPayloadError(CenturionGarageApiClientError):
+    """Exception for oversized or malformed responses from the device."""
+
+
 def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     """Raise for HTTP errors or authentication failures."""
     if response.status in (401, 403):
@@ -23,6 +46,33 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
     response.raise_for_status()
 
 
+async def _async_read_limited(response: aiohttp.ClientResponse, limit: int) -> bytes:
+    """Read the response body, refusing to buffer more than limit bytes."""
+    if response.content_length is not None and response.content_length > limit:
+        msg = f"Response of {response.content_length} bytes exceeds {limit} bytes"
+        raise CenturionGarageApiClientPayloadError(msg)
+    body = bytearray()
+    async for chunk in response.content.iter_any():
+        body += chunk
+        if len(body) > limit:
+            msg = f"Response exceeds {limit} bytes"
+            raise CenturionGarageApiClientPayloadError(msg)
+    return bytes(body)
+
+
+def _parse_status(body: bytes) -> dict:
+    """Decode a status payload, keeping only the fields the integration uses."""
+    try:
+        payload = json_loads(body)
+    except ValueError as exc:
+        msg = f"Malformed status payload: {exc}"
+        raise CenturionGarageApiClientPayloadError(msg) from exc
+    if not isinstance(payload, dict):
+        msg = f"Status payload is a JSON {type(payload).__name__}, expected an object"
+        raise CenturionGarageApiClientPayloadError(msg)
+    return {key: payload[key] for key in STATUS_FIELDS if key in payload}
+
+
 class CenturionGarageApiClient:
     """API client for Centurion Garage Door device."""
 
@@ -38,67 +88,141 @@ class CenturionGarageApiClient:
         self.ip_address = ip_address
         self.api_key = api_key
         self._session = session
+        self.metrics = CenturionGarageMetrics()
+        self.scheduler = CenturionGarageRequestScheduler()
+        self.camera_relay = CenturionGarageMjpegRelay(self)
 
     def _base_url(self) -> str:
         """Return the base URL for API requests."""
         return f"http://{self.ip_address}/api?key={self.api_key}"
 
+    @property
+    def camera_url(self) -> str:
+        """Return the URL of the MJPEG stream served by the controller camera."""
+        return f"http://{self.ip_address}:{CAMERA_PORT}"
+
+    def open_camera_stream(self) -> AbstractAsyncContextManager[aiohttp.ClientResponse]:
+        """Open the MJPEG stream; use camera_relay rather than calling this."""
+        return self._session.get(
+            self.camera_url,
+            timeout=aiohttp.ClientTimeout(
+                total=None, sock_connect=10, sock_read=STREAM_READ_TIMEOUT
+            ),
+        )
+
+    async def _async_request(
+        self,
+        query: str,
+        priority: RequestPriority,
+        timings: deque | None = None,
+        max_bytes: int = RESPONSE_MAX_BYTES,
+        parse: Callable[[bytes], Any] | None = None,
+    ) -> Any:
+        """
+        Issue a GET against the device API and return the response.
+
+        The body is returned as is, or passed through parse first so that a
+        malformed response is recorded as a failed request. Timings record
+        the wait for a scheduler slot separately from the time spent on the
+        device.
+
+        """
+        queued = time.monotonic()
+        started: float | None = None
+        succeeded = False
+        try:
+            async with self.scheduler.async_slot(priority):
+                started = time.monotonic()
+                async with (
+                    async_timeout.timeout(10),
+                    self._session.get(f"{self._base_url()}&{query}") as response,
+                ):
+                    _verify_response_or_raise(response)
+                    body = await _async_read_limited(response, max_bytes)
+                    result = body if parse is None else parse(body)
+                    succeeded = True
+                    return result
+        except CenturionGarageApiClientAuthenticationError:
+            self.metrics.errors["authentication"] += 1
+            raise
+        except CenturionGarageApiClientPayloadError:
+            self.metrics.errors["payload"] += 1
+            raise
+        except TimeoutError as exc:
+            self.metrics.errors["timeout"] += 1
+            msg = f"Timeout talking to {self.ip_address}"
+            raise CenturionGarageApiClientCommunicationError(msg) from exc
+        except aiohttp.ClientError as exc:
+            self.metrics.errors["communication"] += 1
+            msg = f"Error talking to {self.ip_address}: {exc}"
+            raise CenturionGarageApiClientCommunicationError(msg) from exc
+        finally:
+            if timings is not None:
+                finished = time.monotonic()
+                if started is None:
+                    started = finished
+                timings.append(
+                    {
+                        "at": datetime.now(UTC).isoformat(),
+                        "request": query,
+                        "queued": round(started - queued, 4),
+                        "duration": round(finished - started, 4),
+                        "success": succeeded,
+                    }
+                )
+
+    async def _async_command(self, query: str) -> None:
+        """Issue a command request and record its timing."""
+        await self._async_request(
+            query, RequestPriority.COMMAND, self.metrics.command_timings
+        )
+
     async def async_get_data(self) -> dict:
         """Get device status as a dictionary."""
-        async with async_timeout.timeout(10):
-            async with self._session.get(f"{self._base_url()}&status=json") as response:
-                _verify_response_or_raise(response)
-                return await response.json()
+
+        def _record_and_parse(body: bytes) -> dict:
+            self.metrics.status_payloads.append(body)
+            return _parse_status(body)
+
+        return await self._async_request(
+            "status=json",
+            RequestPriority.POLL,
+            self.metrics.poll_timings,
+            parse=_record_and_parse,
+        )
 
     async def open_door(self) -> None:
         """Send command to open the garage door."""
-        async with async_timeout.timeout(10):
-            async with self._session.get(f"{self._base_url()}&door=open") as response:
-                _verify_response_or_raise(response)
+        await self._async_command("door=open")
 
     async def close_door(self) -> None:
         """Send command to close the garage door."""
-        async with async_timeout.timeout(10):
-            async with self._session.get(f"{self._base_url()}&door=close") as response:
-                _verify_response_or_raise(response)
+        await self._async_command("door=close")
 
     async def stop_door(self) -> None:
         """Send command to stop the garage door."""
-        async with async_timeout.timeout(10):
-            async with self._session.get(f"{self._base_url()}&door=stop") as response:
-                _verify_response_or_raise(response)
+        await self._async_command("door=stop")
 
     async def lamp_on(self) -> None:
         """Turn the garage lamp on."""
-        async with async_timeout.timeout(10):
-            async with self._session.get(f"{self._base_url()}&lamp=on") as response:
-                _verify_response_or_raise(response)
+        await self._async_command("lamp=on")
 
     async def lamp_off(self) -> None:
         """Turn the garage lamp off."""
-        async with async_timeout.timeout(10):
-            async with self._session.get(f"{self._base_url()}&lamp=off") as response:
-                _verify_response_or_raise(response)
+        await self._async_command("lamp=off")
 
     async def vacation_on(self) -> None:
         """Enable vacation mode."""
-        async with async_timeout.timeout(10):
-            async with self._session.get(f"{self._base_url()}&vacation=on") as response:
-                _verify_response_or_raise(response)
+        await self._async_command("vacation=on")
 
     async def vacation_off(self) -> None:
         """Disable vacation mode."""
-        async with async_timeout.timeout(10):
-            async with self._session.get(
-                f"{self._base_url()}&vacation=off"
-            ) as response:
-                _verify_response_or_raise(response)
+        await self._async_command("vacation=off")
 
     async def get_camera_image(self) -> bytes | None:
         """Fetch a snapshot image from the camera, if supported."""
-        async with async_timeout.timeout(10):
-            async with self._session.get(
-                f"{self._base_url()}&camera=snapshot"
-            ) as response:
-                _verify_response_or_raise(response)
-                return await response.read()
+        return await self._async_request(
+            "camera=snapshot",
+            RequestPriority.SNAPSHOT,
+            max_bytes=SNAPSHOT_MAX_BYTES,
+        )
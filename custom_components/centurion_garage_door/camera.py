@@ -1,12 +1,14 @@
 """Camera platform for Centurion Garage Door integration."""
 
-from homeassistant.components.mjpeg.camera import MjpegCamera
+from aiohttp import hdrs, web
+from homeassistant.components.camera import Camera
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from custom_components.centurion_garage_door.coordinator import (
     CenturionGarageDataUpdateCoordinator,
 )
+from .api import CenturionGarageApiClientError
 from .entity import CenturionGarageEntity
 from .const import DOMAIN
 import logging
@@ -25,20 +27,67 @@ async def async_setup_entry(
     async_add_entities([CenturionGarageCamera(coordinator)])
 
 
-class CenturionGarageCamera(CenturionGarageEntity, MjpegCamera):
-    """Centurion Garage Door camera entity."""
+class CenturionGarageCamera(CenturionGarageEntity, Camera):
+    """
+    Centurion Garage Door camera entity.
+
+    Stills come from the size-capped snapshot API through the request
+    scheduler. Live viewers share the API client's single MJPEG relay
+    instead of each opening a connection to the controller.
+
+    """
 
     def __init__(self, coordinator: CenturionGarageDataUpdateCoordinator) -> None:
         """Initialize CenturionGarageCamera entity."""
         CenturionGarageEntity.__init__(self, coordinator)
-        ip = coordinator.api_client.ip_address
-        port = 88
-        mjpeg_url = f"http://{ip}:{port}"
-        MjpegCamera.__init__(self, mjpeg_url=mjpeg_url, still_image_url=None)
+        Camera.__init__(self)
         self.coordinator = coordinator
         self._attr_unique_id = "centurion_garage_camera"
         self._attr_name = "Centurion Garage Camera"
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Close the shared camera stream when the entity is removed."""
+        await super().async_will_remove_from_hass()
+        self.coordinator.api_client.camera_relay.stop()
+
+    async def async_camera_image(
+        self,
+        width: int | None = None,  # noqa: ARG002
+        height: int | None = None,  # noqa: ARG002
+    ) -> bytes | None:
+        """Return a still image from the controller snapshot API at full size."""
+        try:
+            return await self.coordinator.api_client.get_camera_image()
+        except CenturionGarageApiClientError as exc:
+            _LOGGER.debug("Camera snapshot failed: %s", exc)
+            return None
+
+    async def handle_async_mjpeg_stream(
+        self, request: web.Request
+    ) -> web.StreamResponse | None:
+        """Serve the shared MJPEG relay to a viewer."""
+        api_client = self.coordinator.api_client
+        metrics = api_client.metrics
+        metrics.stream_connects += 1
+        metrics.stream_subscribers += 1
+        try:
+            subscription = await api_client.camera_relay.async_subscribe()
+            if subscription is None:
+                return None
+            content_type, queue = subscription
+            try:
+                response = web.StreamResponse(headers={hdrs.CONTENT_TYPE: content_type})
+                await response.prepare(request)
+                while (chunk := await queue.get()) is not None:
+                    await response.write(chunk)
+            except ConnectionResetError:
+                _LOGGER.debug("Camera viewer disconnected")
+            finally:
+                api_client.camera_relay.unsubscribe(queue)
+            return response
+        finally:
+            metrics.stream_subscribers -= 1
+
     @property
     def brand(self) -> str:
         """Return the camera brand."""
@@ -59,9 +108,8 @@ class CenturionGarageCamera(CenturionGarageEntity, MjpegCamera):
     @property
     def device_info(self) -> dict:
         """Return device information for Home Assistant."""
-        api_client = self.coordinator.api_client
         return {
-            "identifiers": {(DOMAIN, api_client.ip_address)},
+            "identifiers": {(DOMAIN, self.device_identifier)},
             "name": "Camera",
             "manufacturer": "Centurion",
             "model": "Garage",
@@ -2,13 +2,16 @@
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import (
     DOMAIN,
     CONF_IP_ADDRESS,
     CONF_API_KEY,
+    CONF_MAC,
     CONF_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
 )
+from .discovery import CenturionGarageDiscovery, async_probe_host
 
 
 class CenturionGarageDoorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -16,10 +19,30 @@ class CenturionGarageDoorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: dict[str, str | None] = {}
+        self._user_input: dict = {}
+
+    async def _async_create_controller_entry(
+        self, user_input: dict, mac: str | None
+    ) -> object:
+        """Create the entry, keyed on the controller MAC when it is known."""
+        if mac is not None:
+            user_input[CONF_MAC] = mac
+            await self.async_set_unique_id(mac)
+            self._abort_if_unique_id_configured(
+                updates={CONF_IP_ADDRESS: user_input[CONF_IP_ADDRESS]}
+            )
+        return self.async_create_entry(title="Centurion Garage", data=user_input)
+
     async def async_step_user(self, user_input: dict | None = None) -> object:
         """
         Handle the initial step of the config flow.
 
+        Leaving the IP address empty scans the local subnet for controllers
+        that answer the status API with the given API key.
+
         Args:
             user_input: Optional dictionary with user input from the form.
 
@@ -27,6 +50,7 @@ class CenturionGarageDoorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ConfigFlowResult: The result of the config flow step.
 
         """
+        errors: dict[str, str] = {}
         if user_input is not None:
             scan_interval = user_input.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
             try:
@@ -34,13 +58,35 @@ class CenturionGarageDoorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except (TypeError, ValueError):
                 scan_interval = DEFAULT_SCAN_INTERVAL
             user_input[CONF_SCAN_INTERVAL] = scan_interval
-            return self.async_create_entry(title="Centurion Garage", data=user_input)
+
+            session = async_get_clientsession(self.hass)
+            discovery = CenturionGarageDiscovery(
+                self.hass, session, user_input[CONF_API_KEY]
+            )
+            if ip_address := user_input.get(CONF_IP_ADDRESS):
+                # A successful probe also puts the host in the ARP table.
+                if await async_probe_host(
+                    session, ip_address, user_input[CONF_API_KEY]
+                ):
+                    mac = await discovery.async_lookup_mac(ip_address)
+                    return await self._async_create_controller_entry(user_input, mac)
+                errors["base"] = "cannot_connect"
+            else:
+                self._discovered = await discovery.async_scan()
+                if len(self._discovered) == 1:
+                    ip_address, mac = next(iter(self._discovered.items()))
+                    user_input[CONF_IP_ADDRESS] = ip_address
+                    return await self._async_create_controller_entry(user_input, mac)
+                if self._discovered:
+                    self._user_input = user_input
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
 
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
                 {
-                    vol.Required(CONF_IP_ADDRESS): str,
+                    vol.Optional(CONF_IP_ADDRESS): str,
                     vol.Required(CONF_API_KEY): str,
                     vol.Optional(
                         CONF_SCAN_INTERVAL,
@@ -48,6 +94,25 @@ class CenturionGarageDoorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     ): int,
                 }
             ),
+            errors=errors,
+        )
+
+    async def async_step_pick(self, user_input: dict | None = None) -> object:
+        """Let the user choose between several discovered controllers."""
+        if user_input is not None:
+            ip_address = user_input[CONF_IP_ADDRESS]
+            data = {**self._user_input, CONF_IP_ADDRESS: ip_address}
+            return await self._async_create_controller_entry(
+                data, self._discovered.get(ip_address)
+            )
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_IP_ADDRESS): vol.In(sorted(self._discovered)),
+                }
+            ),
         )
 
     async def async_step_options(self, user_input: dict | None = None) -> object:
@@ -5,3 +5,17 @@ CONF_IP_ADDRESS = "ip_address"
 CONF_API_KEY = "api_key"
 CONF_SCAN_INTERVAL = "scan_interval"
 DEFAULT_SCAN_INTERVAL = 10  # seconds
+CONF_MAC = "mac"
+DATA_DISCOVERY_CACHE = f"{DOMAIN}_discovery_cache"
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_PREFIX_LENGTH = 24  # widest subnet scanned per adapter address
+DISCOVERY_PROBE_TIMEOUT = 2  # seconds
+REDISCOVERY_COOLDOWN = 300  # seconds
+DIAGNOSTICS_HISTORY = 20
+RESPONSE_MAX_BYTES = 16 * 1024
+SNAPSHOT_MAX_BYTES = 2 * 1024 * 1024
+STATUS_FIELDS = ("door", "lamp", "vacation", "wdBm", "cycles")
+MAX_CONCURRENT_REQUESTS = 1
+CAMERA_PORT = 88
+STREAM_READ_TIMEOUT = 30  # seconds
+STREAM_VIEWER_BUFFER = 64  # chunks queued per viewer before it is dropped
@@ -1,16 +1,23 @@
 """DataUpdateCoordinator for Centurion Garage Door."""
 
 from __future__ import annotations
+import time
 from typing import TYPE_CHECKING
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .api import (
     CenturionGarageApiClientAuthenticationError,
+    CenturionGarageApiClientCommunicationError,
     CenturionGarageApiClientError,
     CenturionGarageApiClient,
 )
+from .const import CONF_IP_ADDRESS, CONF_MAC, DOMAIN
+from .discovery import CenturionGarageDiscovery
 
 if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from datetime import timedelta
     import logging
@@ -28,9 +35,9 @@ class CenturionGarageDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(
         self,
         hass: HomeAssistant,
+        config_entry: ConfigEntry,
         api_client: CenturionGarageApiClient,
         logger: logging.Logger,
-        name: str,
         update_interval: timedelta,
     ) -> None:
         """
@@ -38,19 +45,98 @@ class CenturionGarageDataUpdateCoordinator(DataUpdateCoordinator):
 
         Args:
             hass: Home Assistant instance.
+            config_entry: Config entry updated when the device IP changes.
             api_client: CenturionGarageApiClient instance for device communication.
             logger: Logger for integration logging.
-            name: Name of the coordinator.
             update_interval: Interval for periodic updates.
 
         """
         super().__init__(
-            hass, logger=logger, name=name, update_interval=update_interval
+            hass,
+            logger=logger,
+            name=DOMAIN,
+            update_interval=update_interval,
+            config_entry=config_entry,
         )
         self.api_client = api_client
+        self.discovery = CenturionGarageDiscovery(
+            hass,
+            async_get_clientsession(hass),
+            api_client.api_key,
+            api_client.scheduler,
+        )
+        self._last_poll: float | None = None
+
+    async def _async_rebind(self) -> bool:
+        """
+        Locate the device by MAC after an IP change and rebind the client.
+
+        The entry data is updated for the next restart only; the update
+        listener ignores IP changes so the entry is not reloaded.
+
+        """
+        entry = self.config_entry
+        if entry is None or not entry.data.get(CONF_MAC):
+            return False
+        ip_address = await self.discovery.async_locate(entry.data[CONF_MAC])
+        if ip_address is None or ip_address == self.api_client.ip_address:
+            return False
+        self.logger.info(
+            "Centurion controller moved from %s to %s",
+            self.api_client.ip_address,
+            ip_address,
+        )
+        self.api_client.ip_address = ip_address
+        self.hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_IP_ADDRESS: ip_address}
+        )
+        return True
+
+    async def async_backfill_mac(self) -> None:
+        """
+        Record the controller MAC for entries created before discovery existed.
+
+        The existing device is re-keyed from its IP to the MAC so it is not
+        orphaned, and the MAC becomes the entry unique_id if it has none.
+
+        """
+        entry = self.config_entry
+        if entry is None or entry.data.get(CONF_MAC):
+            return
+        ip_address = self.api_client.ip_address
+        mac = await self.discovery.async_lookup_mac(ip_address)
+        if mac is None:
+            return
+        device_registry = dr.async_get(self.hass)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, ip_address)}
+        ):
+            device_registry.async_update_device(
+                device.id, new_identifiers={(DOMAIN, mac)}
+            )
+        unique_id = entry.unique_id
+        if unique_id is None and (
+            self.hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, mac)
+            is None
+        ):
+            unique_id = mac
+        self.hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_MAC: mac}, unique_id=unique_id
+        )
 
     async def _async_update_data(self) -> dict:
+        now = time.monotonic()
+        if self._last_poll is not None:
+            self.api_client.metrics.update_intervals.append(
+                round(now - self._last_poll, 3)
+            )
+        self._last_poll = now
         try:
+            try:
+                return await self.api_client.async_get_data()
+            except CenturionGarageApiClientCommunicationError:
+                if not await self._async_rebind():
+                    raise
             return await self.api_client.async_get_data()
         except CenturionGarageApiClientAuthenticationError as exc:
             raise ConfigEntryAuthFailed(exc) from exc
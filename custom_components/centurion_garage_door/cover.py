@@ -46,9 +46,8 @@ class CenturionGarageDoor(CenturionGarageEntity, CoverEntity):
     @property
     def device_info(self) -> dict:
         """Return device information for Home Assistant."""
-        api_client = self.coordinator.api_client
         return {
-            "identifiers": {(DOMAIN, api_client.ip_address)},
+            "identifiers": {(DOMAIN, self.device_identifier)},
             "name": "Door",
             "manufacturer": "Centurion",
             "model": "Garage",
@@ -1,6 +1,13 @@
 """Custom types for Centurion Garage Door."""
 
-from dataclasses import dataclass
+from collections import Counter, deque
+from dataclasses import dataclass, field
+
+from .const import DIAGNOSTICS_HISTORY
+
+
+def _history() -> deque:
+    return deque(maxlen=DIAGNOSTICS_HISTORY)
 
 
 @dataclass
@@ -8,3 +15,28 @@ class CenturionGarageRuntimeData:
     client: object
     coordinator: object
     integration: object
+    settings: dict = field(default_factory=dict)
+
+
+@dataclass
+class CenturionGarageMetrics:
+    """Bounded performance history for a single controller."""
+
+    status_payloads: deque = field(default_factory=_history)
+    poll_timings: deque = field(default_factory=_history)
+    command_timings: deque = field(default_factory=_history)
+    update_intervals: deque = field(default_factory=_history)
+    errors: Counter = field(default_factory=Counter)
+    stream_subscribers: int = 0
+    stream_connects: int = 0
+    upstream_connects: int = 0
+
+
+@dataclass
+class CenturionGarageDiscoveryCache:
+    """MAC to IP cache and rediscovery cooldowns shared across the domain."""
+
+    macs: dict[str, str] = field(default_factory=dict)
+    last_scan: dict[str, float] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
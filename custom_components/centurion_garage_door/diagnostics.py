@@ -0,0 +1,78 @@
+"""Diagnostics support for Centurion Garage Door."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.util.json import json_loads
+
+from .const import CONF_API_KEY, CONF_MAC, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+TO_REDACT = {CONF_API_KEY, CONF_MAC, "key", "serial", "ssid"}
+MALFORMED_PAYLOAD_PREVIEW = 256
+
+
+def _redact_payload(payload: bytes) -> Any:
+    """Decode and redact a raw status payload, truncating it if malformed."""
+    try:
+        return async_redact_data(json_loads(payload), TO_REDACT)
+    except ValueError:
+        return payload[:MALFORMED_PAYLOAD_PREVIEW].decode("utf-8", "replace")
+
+
+def _ratio(hits: int, misses: int) -> float | None:
+    """Return the hit ratio, or None when nothing was looked up yet."""
+    total = hits + misses
+    return round(hits / total, 3) if total else None
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    runtime_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = runtime_data.coordinator
+    metrics = coordinator.api_client.metrics
+    discovery = coordinator.discovery
+    scheduler = coordinator.api_client.scheduler
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "recent_update_intervals": list(metrics.update_intervals),
+            "data": coordinator.data,
+        },
+        "status_payloads": [
+            _redact_payload(payload) for payload in metrics.status_payloads
+        ],
+        "poll_timings": list(metrics.poll_timings),
+        "command_timings": list(metrics.command_timings),
+        "errors": dict(metrics.errors),
+        "camera": {
+            "stream_subscribers": metrics.stream_subscribers,
+            "stream_connects": metrics.stream_connects,
+            "upstream_connected": coordinator.api_client.camera_relay.connected,
+            "upstream_connects": metrics.upstream_connects,
+        },
+        "scheduler": {
+            "active": scheduler.active,
+            "waiting": scheduler.waiting,
+        },
+        "cache": {
+            "discovery_hits": discovery.cache.hits,
+            "discovery_misses": discovery.cache.misses,
+            "discovery_hit_ratio": _ratio(discovery.cache.hits, discovery.cache.misses),
+        },
+    }
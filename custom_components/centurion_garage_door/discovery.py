@@ -0,0 +1,246 @@
+"""Local network discovery for Centurion Garage Door controllers."""
+
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+import time
+from http import HTTPStatus
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import aiohttp
+import async_timeout
+from homeassistant.components import network
+from homeassistant.helpers.device_registry import format_mac
+
+from .api import CenturionGarageApiClientError, _async_read_limited, _parse_status
+from .const import (
+    DATA_DISCOVERY_CACHE,
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_PREFIX_LENGTH,
+    DISCOVERY_PROBE_TIMEOUT,
+    REDISCOVERY_COOLDOWN,
+    RESPONSE_MAX_BYTES,
+)
+from .data import CenturionGarageDiscoveryCache
+from .scheduler import RequestPriority
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .scheduler import CenturionGarageRequestScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+ARP_TABLE_PATH = Path("/proc/net/arp")
+_ARP_MAC_FIELD = 3
+_INCOMPLETE_MAC = "00:00:00:00:00:00"
+_FINGERPRINT_STATUSES = (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN)
+
+
+def _read_arp_table() -> dict[str, str]:
+    """Return the kernel neighbour table as an IP to MAC mapping."""
+    table: dict[str, str] = {}
+    try:
+        with ARP_TABLE_PATH.open(encoding="ascii") as arp:
+            next(arp, None)
+            for line in arp:
+                fields = line.split()
+                if len(fields) <= _ARP_MAC_FIELD:
+                    continue
+                if fields[_ARP_MAC_FIELD] != _INCOMPLETE_MAC:
+                    table[fields[0]] = format_mac(fields[_ARP_MAC_FIELD])
+    except OSError:
+        return {}
+    return table
+
+
+async def async_fingerprint_host(
+    session: aiohttp.ClientSession, ip_address: str
+) -> bool:
+    """
+    Return True if the host looks like a Centurion controller.
+
+    No credentials are sent. The controller rejects a keyless status request
+    on /api with 401 or 403 and, unlike routers and printers behind HTTP
+    authentication, without a WWW-Authenticate challenge.
+
+    """
+    url = f"http://{ip_address}/api?status=json"
+    try:
+        async with (
+            async_timeout.timeout(DISCOVERY_PROBE_TIMEOUT),
+            session.get(url, allow_redirects=False) as response,
+        ):
+            return (
+                response.status in _FINGERPRINT_STATUSES
+                and aiohttp.hdrs.WWW_AUTHENTICATE not in response.headers
+            )
+    except (TimeoutError, aiohttp.ClientError):
+        return False
+
+
+async def async_probe_host(
+    session: aiohttp.ClientSession, ip_address: str, api_key: str
+) -> bool:
+    """Return True if a Centurion controller answers the status API at the IP."""
+    url = f"http://{ip_address}/api?key={api_key}&status=json"
+    try:
+        async with (
+            async_timeout.timeout(DISCOVERY_PROBE_TIMEOUT),
+            session.get(url) as response,
+        ):
+            if response.status != HTTPStatus.OK:
+                return False
+            payload = _parse_status(
+                await _async_read_limited(response, RESPONSE_MAX_BYTES)
+            )
+    except (TimeoutError, aiohttp.ClientError, CenturionGarageApiClientError):
+        return False
+    return "door" in payload
+
+
+class CenturionGarageDiscovery:
+    """
+    Discover Centurion controllers on the local subnet.
+
+    Probes hosts concurrently behind a bounded semaphore. The API key is only
+    sent to hosts that pass the keyless fingerprint, and those keyed probes go
+    through the controller's request scheduler when one is given. The MAC to
+    IP cache and rediscovery cooldowns live in hass.data, so they survive
+    entry reloads.
+
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        session: aiohttp.ClientSession,
+        api_key: str,
+        scheduler: CenturionGarageRequestScheduler | None = None,
+    ) -> None:
+        """
+        Initialize the CenturionGarageDiscovery.
+
+        Args:
+            hass: Home Assistant instance.
+            session: aiohttp ClientSession for HTTP requests.
+            api_key: API key used to confirm a fingerprinted controller.
+            scheduler: Request scheduler of the controller being located.
+
+        """
+        self._hass = hass
+        self._session = session
+        self._api_key = api_key
+        self._scheduler = scheduler
+        self.cache: CenturionGarageDiscoveryCache = hass.data.setdefault(
+            DATA_DISCOVERY_CACHE, CenturionGarageDiscoveryCache()
+        )
+
+    async def _async_subnets(self) -> list[ipaddress.IPv4Network]:
+        """
+        Return the subnets to scan, one per enabled IPv4 adapter address.
+
+        Each subnet uses the adapter's own prefix, narrowed to at most a /24
+        around the address. Falls back to the /24 around the Home Assistant
+        source IP if no adapter reports an IPv4 address.
+
+        """
+        subnets: list[ipaddress.IPv4Network] = []
+        for adapter in await network.async_get_adapters(self._hass):
+            if not adapter["enabled"]:
+                continue
+            for address in adapter["ipv4"]:
+                prefix = max(address["network_prefix"], DISCOVERY_PREFIX_LENGTH)
+                subnet = ipaddress.ip_network(
+                    f"{address['address']}/{prefix}", strict=False
+                )
+                if not subnet.is_loopback and subnet not in subnets:
+                    subnets.append(subnet)
+        if not subnets:
+            source_ip = await network.async_get_source_ip(self._hass)
+            subnets.append(
+                ipaddress.ip_network(
+                    f"{source_ip}/{DISCOVERY_PREFIX_LENGTH}", strict=False
+                )
+            )
+        return subnets
+
+    async def _async_probe(self, ip_address: str) -> bool:
+        """Probe a host with the API key, within the controller's request budget."""
+        if self._scheduler is None:
+            return await async_probe_host(self._session, ip_address, self._api_key)
+        async with self._scheduler.async_slot(RequestPriority.POLL):
+            return await async_probe_host(self._session, ip_address, self._api_key)
+
+    async def async_lookup_mac(self, ip_address: str) -> str | None:
+        """Return the MAC address for an IP from the kernel neighbour table."""
+        table = await self._hass.async_add_executor_job(_read_arp_table)
+        return table.get(ip_address)
+
+    async def async_scan(self) -> dict[str, str | None]:
+        """Probe the local subnet and return discovered controllers as IP to MAC."""
+        subnets = await self._async_subnets()
+        hosts = dict.fromkeys(str(ip) for subnet in subnets for ip in subnet.hosts())
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+        async def _probe(ip_address: str) -> str | None:
+            async with semaphore:
+                if not await async_fingerprint_host(self._session, ip_address):
+                    return None
+                if await self._async_probe(ip_address):
+                    return ip_address
+                return None
+
+        results = await asyncio.gather(*(_probe(ip) for ip in hosts))
+        found = [ip for ip in results if ip is not None]
+        if not found:
+            return {}
+
+        table = await self._hass.async_add_executor_job(_read_arp_table)
+        discovered: dict[str, str | None] = {}
+        for ip_address in found:
+            mac = table.get(ip_address)
+            discovered[ip_address] = mac
+            if mac is not None:
+                self.cache.macs[mac] = ip_address
+        _LOGGER.debug("Discovered controllers on %s: %s", subnets, discovered)
+        return discovered
+
+    async def async_locate(self, mac: str) -> str | None:
+        """
+        Return the current IP address of the controller with the given MAC.
+
+        The MAC to IP cache and the kernel neighbour table are consulted
+        first; a full subnet scan runs at most once per cooldown period for
+        each MAC.
+
+        """
+        mac = format_mac(mac)
+        candidates = []
+        if (cached := self.cache.macs.get(mac)) is not None:
+            candidates.append(cached)
+        table = await self._hass.async_add_executor_job(_read_arp_table)
+        candidates.extend(ip for ip, entry in table.items() if entry == mac)
+
+        for ip_address in dict.fromkeys(candidates):
+            if await self._async_probe(ip_address):
+                self.cache.hits += 1
+                self.cache.macs[mac] = ip_address
+                return ip_address
+
+        self.cache.misses += 1
+        last_scan = self.cache.last_scan.get(mac)
+        if (
+            last_scan is not None
+            and time.monotonic() - last_scan < REDISCOVERY_COOLDOWN
+        ):
+            return None
+        self.cache.last_scan[mac] = time.monotonic()
+        discovered = await self.async_scan()
+        for ip_address, found_mac in discovered.items():
+            if found_mac == mac:
+                return ip_address
+        return None
@@ -10,6 +10,8 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
+from .const import CONF_MAC
+
 
 class CenturionGarageEntity(CoordinatorEntity):
     """Base entity for Centurion Garage Door integration."""
@@ -17,3 +19,12 @@ class CenturionGarageEntity(CoordinatorEntity):
     def __init__(self, coordinator: DataUpdateCoordinator) -> None:
         """Initialize CenturionGarageEntity with coordinator."""
         super().__init__(coordinator)
+
+    @property
+    def device_identifier(self) -> str:
+        """Return the device registry key, the MAC when known, else the IP."""
+        entry = getattr(self.coordinator, "config_entry", None)
+        if entry is not None and (mac := entry.data.get(CONF_MAC)):
+            return mac
+        api_client = getattr(self.coordinator, "api_client", None)
+        return getattr(api_client, "ip_address", "unknown") if api_client else "unknown"
@@ -0,0 +1,158 @@
+"""Per-device request scheduling for Centurion Garage Door."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from .const import MAX_CONCURRENT_REQUESTS
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+
+class RequestPriority(IntEnum):
+    """Priority tiers for device I/O, lowest value is served first."""
+
+    COMMAND = 0
+    POLL = 1
+    SNAPSHOT = 2
+    STREAM = 3
+
+
+# Refill rate per second and burst size; commands are never rate limited.
+REQUEST_RATE_LIMITS: dict[RequestPriority, tuple[float, int]] = {
+    RequestPriority.POLL: (2.0, 2),
+    RequestPriority.SNAPSHOT: (1.0, 2),
+    RequestPriority.STREAM: (0.2, 2),
+}
+
+
+class _TokenBucket:
+    """Token bucket rate limiter."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the bucket with a refill rate per second and a burst size."""
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    async def async_acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self._burst, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class CenturionGarageRequestScheduler:
+    """
+    Priority scheduler for all I/O against a single controller.
+
+    Request/response calls share a small number of slots that are handed
+    out in priority order, so a door command never queues behind camera
+    snapshots. Each tier is rate limited by its own token bucket. The
+    long-lived MJPEG stream sits below every tier: it connects only when no
+    request is in flight and pauses its reads whenever one is.
+
+    """
+
+    def __init__(
+        self,
+        concurrency: int = MAX_CONCURRENT_REQUESTS,
+        rate_limits: dict[RequestPriority, tuple[float, int]] | None = None,
+    ) -> None:
+        """
+        Initialize the CenturionGarageRequestScheduler.
+
+        Args:
+            concurrency: Number of requests allowed in flight at once.
+            rate_limits: Per-tier refill rate and burst, REQUEST_RATE_LIMITS
+                when omitted.
+
+        """
+        self._concurrency = concurrency
+        self._active = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        if rate_limits is None:
+            rate_limits = REQUEST_RATE_LIMITS
+        self._buckets = {
+            priority: _TokenBucket(rate, burst)
+            for priority, (rate, burst) in rate_limits.items()
+        }
+
+    @property
+    def active(self) -> int:
+        """Return the number of requests in flight."""
+        return self._active
+
+    @property
+    def waiting(self) -> dict[str, int]:
+        """Return the number of queued requests per tier."""
+        waiting = {priority.name.lower(): 0 for priority in RequestPriority}
+        for priority, _, future in self._waiters:
+            if not future.done():
+                waiting[RequestPriority(priority).name.lower()] += 1
+        return waiting
+
+    async def _async_acquire(self, priority: RequestPriority) -> None:
+        """Wait for a request slot, served in priority then arrival order."""
+        if self._active < self._concurrency:
+            self._active += 1
+            self._idle.clear()
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot to the highest priority waiter, or free it."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+        if self._active == 0:
+            self._idle.set()
+
+    @asynccontextmanager
+    async def async_slot(self, priority: RequestPriority) -> AsyncIterator[None]:
+        """Hold a request slot for the given tier."""
+        if (bucket := self._buckets.get(priority)) is not None:
+            await bucket.async_acquire()
+        await self._async_acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def async_wait_idle(self) -> None:
+        """Wait until no request is in flight or queued."""
+        await self._idle.wait()
+
+    async def async_admit_stream(self) -> None:
+        """Wait for a stream connect token and for all requests to finish."""
+        if (bucket := self._buckets.get(RequestPriority.STREAM)) is not None:
+            await bucket.async_acquire()
+        await self.async_wait_idle()
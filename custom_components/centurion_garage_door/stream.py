@@ -0,0 +1,144 @@
+"""Shared MJPEG relay for the Centurion Garage Door camera."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from .const import STREAM_VIEWER_BUFFER
+
+if TYPE_CHECKING:
+    from .api import CenturionGarageApiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STREAM_CONTENT_TYPE = "multipart/x-mixed-replace"
+
+
+class CenturionGarageMjpegRelay:
+    """
+    Share one upstream MJPEG connection between every viewer.
+
+    The upstream connection opens for the first viewer and closes when the
+    last one leaves. It is admitted through the lowest scheduler tier and
+    pauses its reads while any request is in flight, so watching the camera
+    never delays a door command. Viewers that fall behind are dropped rather
+    than buffered without bound.
+
+    """
+
+    def __init__(self, api_client: CenturionGarageApiClient) -> None:
+        """
+        Initialize the CenturionGarageMjpegRelay.
+
+        Args:
+            api_client: CenturionGarageApiClient for the controller camera.
+
+        """
+        self._api_client = api_client
+        self._viewers: set[asyncio.Queue[bytes | None]] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._content_type: asyncio.Future[str | None] | None = None
+
+    @property
+    def viewers(self) -> int:
+        """Return the number of viewers attached to the relay."""
+        return len(self._viewers)
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the upstream connection is running."""
+        return self._task is not None and not self._task.done()
+
+    async def async_subscribe(
+        self,
+    ) -> tuple[str, asyncio.Queue[bytes | None]] | None:
+        """
+        Attach a viewer and return the stream content type and its queue.
+
+        The queue yields upstream chunks and None once the stream ends.
+        Returns None if the upstream connection could not be opened.
+
+        """
+        queue: asyncio.Queue[bytes | None] = asyncio.Queue(STREAM_VIEWER_BUFFER)
+        self._viewers.add(queue)
+        if not self.connected:
+            self._content_type = asyncio.get_running_loop().create_future()
+            self._task = asyncio.create_task(self._async_relay(self._content_type))
+        try:
+            content_type = await asyncio.shield(self._content_type)
+        except BaseException:
+            self.unsubscribe(queue)
+            raise
+        if content_type is None:
+            self.unsubscribe(queue)
+            return None
+        return content_type, queue
+
+    def unsubscribe(self, queue: asyncio.Queue[bytes | None]) -> None:
+        """Detach a viewer, closing the upstream after the last one."""
+        self._viewers.discard(queue)
+        if not self._viewers:
+            self.stop()
+
+    def stop(self) -> None:
+        """Close the upstream connection and end every viewer."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._end_viewers()
+
+    def _end_viewers(self) -> None:
+        """Signal the end of the stream to every attached viewer."""
+        for queue in self._viewers:
+            _end_queue(queue)
+        self._viewers.clear()
+
+    def _publish(self, chunk: bytes) -> None:
+        """Queue a chunk for every viewer, dropping those that fell behind."""
+        for queue in list(self._viewers):
+            if queue.full():
+                self._viewers.discard(queue)
+                _end_queue(queue)
+            else:
+                queue.put_nowait(chunk)
+
+    async def _async_relay(self, content_type: asyncio.Future[str | None]) -> None:
+        """Read the upstream stream and fan it out to the viewers."""
+        api_client = self._api_client
+        scheduler = api_client.scheduler
+        try:
+            await scheduler.async_admit_stream()
+            async with api_client.open_camera_stream() as response:
+                response.raise_for_status()
+                api_client.metrics.upstream_connects += 1
+                content_type.set_result(
+                    response.headers.get(
+                        aiohttp.hdrs.CONTENT_TYPE, DEFAULT_STREAM_CONTENT_TYPE
+                    )
+                )
+                while self._viewers:
+                    await scheduler.async_wait_idle()
+                    chunk = await response.content.readany()
+                    if not chunk:
+                        break
+                    self._publish(chunk)
+        except (TimeoutError, aiohttp.ClientError) as exc:
+            api_client.metrics.errors["stream"] += 1
+            _LOGGER.debug("Camera stream from %s ended: %s", api_client.ip_address, exc)
+        finally:
+            if not content_type.done():
+                content_type.set_result(None)
+            if self._task is asyncio.current_task():
+                self._task = None
+                self._end_viewers()
+
+
+def _end_queue(queue: asyncio.Queue[bytes | None]) -> None:
+    """Put the end-of-stream marker on a queue, making room if needed."""
+    while queue.full():
+        queue.get_nowait()
+    queue.put_nowait(None)
@@ -44,10 +44,8 @@ class CenturionBaseSwitch(CenturionGarageEntity, SwitchEntity):
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information for Home Assistant."""
-        api_client = getattr(self.coordinator, "api_client", None)
-        ip = getattr(api_client, "ip_address", "unknown") if api_client else "unknown"
         return DeviceInfo(
-            identifiers={(DOMAIN, ip)},
+            identifiers={(DOMAIN, self.device_identifier)},
             name="Switch",
             manufacturer="Centurion",
             model="Garage",
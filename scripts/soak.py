@@ -0,0 +1,612 @@
+"""
+Soak test for the Centurion Garage Door coordinator, API client and camera.
+
+Hosts the integration's real coordinator in an in-process Home Assistant
+instance and runs it, with the API client, request scheduler and camera
+entity, against a local fake controller. Time is accelerated by scaling every
+token bucket rate, so the production scheduler paces the run and months of
+polling are compressed into minutes. Some polls fail on purpose and the fake
+controller periodically moves to another address, so the rebind path runs
+through the discovery cache and a stand-in neighbour table. Viewers connect to
+the camera's MJPEG handler through a local aiohttp route, as they would through
+the Home Assistant camera proxy.
+
+Resource usage is sampled throughout and the run fails if RSS, open sockets,
+pending tasks or traced Python memory keep growing after warm-up, if camera
+subscribers or the upstream stream outlive their viewers, or if failed polls
+and rebinds do not match what the fake controller injected.
+
+Not covered: the full subnet scan, which would probe the real network, and
+Home Assistant's own camera proxy view and platform setup.
+
+Usage:
+    scripts/soak [--polls N] [--streams N] [--viewers N] [--time-scale N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from datetime import timedelta
+from pathlib import Path
+from types import MappingProxyType
+
+import aiohttp
+from aiohttp import web
+from homeassistant.components import network
+from homeassistant.config_entries import SOURCE_USER, ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from custom_components.centurion_garage_door import discovery
+from custom_components.centurion_garage_door.api import CenturionGarageApiClient
+from custom_components.centurion_garage_door.camera import CenturionGarageCamera
+from custom_components.centurion_garage_door.const import (
+    CONF_API_KEY,
+    CONF_IP_ADDRESS,
+    CONF_MAC,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
+from custom_components.centurion_garage_door.coordinator import (
+    CenturionGarageDataUpdateCoordinator,
+)
+from custom_components.centurion_garage_door.scheduler import (
+    REQUEST_RATE_LIMITS,
+    CenturionGarageRequestScheduler,
+)
+
+LOGGER = logging.getLogger(f"{DOMAIN}.soak")
+
+API_KEY = "soak"
+MAC = "02:00:00:00:50:a4"
+COMMAND_EVERY = 50
+SNAPSHOT_EVERY = 100
+FAIL_EVERY = 500  # polls between injected controller errors
+MOVE_EVERY = 2_000  # polls between controller address changes
+FRAMES_PER_STREAM = 3
+SETTLE_TIMEOUT = 5  # seconds for viewers and the upstream to wind down
+SAMPLE_WINDOW = 30  # samples compared at the start and end of the run
+JPEG_FRAME = b"\xff\xd8" + b"\x00" * 2048 + b"\xff\xd9"
+BOUNDARY = "frame"
+
+# Allowed growth between the first and last samples.
+RSS_TOLERANCE = 8 * 1024 * 1024
+TRACED_TOLERANCE = 2 * 1024 * 1024
+SOCKET_TOLERANCE = 2
+TASK_TOLERANCE = 2
+
+
+class FakeController:
+    """Minimal HTTP stand-in for a Centurion controller and its camera."""
+
+    def __init__(self) -> None:
+        """Initialize the fake controller state."""
+        self._states = itertools.cycle(["closed", "opening", "open", "closing"])
+        self._door = "closed"
+        self._lamp = "off"
+        self._cycles = 0
+        self.ports: list[int] = []
+        self.port: int | None = None
+        self.fail_next = False
+        self.requests = 0
+
+    @property
+    def host(self) -> str:
+        """Return the address the controller currently answers on."""
+        return f"127.0.0.1:{self.port}"
+
+    def move(self) -> str:
+        """Move the controller to its other address and return it."""
+        self.port = next(port for port in self.ports if port != self.port)
+        return self.host
+
+    async def handle_api(self, request: web.Request) -> web.Response:
+        """Serve the status, command and snapshot API."""
+        self.requests += 1
+        sockname = request.transport.get_extra_info("sockname")
+        if sockname is None or sockname[1] != self.port:
+            raise web.HTTPServiceUnavailable
+        query = request.query
+        if query.get("key") != API_KEY:
+            return web.Response(status=401)
+        if "door" in query:
+            self._door = next(self._states)
+            self._cycles += 1
+        elif "lamp" in query:
+            self._lamp = query["lamp"]
+        elif query.get("camera") == "snapshot":
+            return web.Response(body=JPEG_FRAME, content_type="image/jpeg")
+        elif query.get("status") == "json":
+            if self.fail_next:
+                self.fail_next = False
+                raise web.HTTPInternalServerError
+            return web.json_response(
+                {
+                    "door": self._door,
+                    "lamp": self._lamp,
+                    "vacation": "off",
+                    "wdBm": -55,
+                    "cycles": self._cycles,
+                    "firmware": "soak",
+                }
+            )
+        return web.Response(text="OK")
+
+    async def handle_stream(self, request: web.Request) -> web.StreamResponse:
+        """Serve an endless MJPEG stream until the client disconnects."""
+        response = web.StreamResponse(
+            headers={"Content-Type": f"multipart/x-mixed-replace; boundary={BOUNDARY}"}
+        )
+        await response.prepare(request)
+        header = (
+            f"--{BOUNDARY}\r\nContent-Type: image/jpeg\r\n"
+            f"Content-Length: {len(JPEG_FRAME)}\r\n\r\n"
+        ).encode()
+        try:
+            while True:
+                await response.write(header + JPEG_FRAME + b"\r\n")
+                await asyncio.sleep(0)
+        except ConnectionResetError:
+            pass
+        return response
+
+    def application(self) -> web.Application:
+        """Return the aiohttp application serving both endpoints."""
+        app = web.Application()
+        app.router.add_get("/api", self.handle_api)
+        app.router.add_get("/stream", self.handle_stream)
+        return app
+
+
+def _write_arp_table(path: Path, host: str) -> None:
+    """Write a neighbour table that maps the controller MAC to host."""
+    path.write_text(
+        "IP address       HW type     Flags       HW address            Mask     "
+        f"Device\n{host} 0x1 0x2 {MAC} * lo\n",
+        encoding="ascii",
+    )
+
+
+def _rss_bytes() -> int:
+    """Return the current resident set size of this process."""
+    try:
+        pages = Path("/proc/self/statm").read_text().split()[1]
+        return int(pages) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        import resource  # noqa: PLC0415
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _open_sockets() -> int:
+    """Return the number of open socket file descriptors of this process."""
+    count = 0
+    fd_dir = Path("/proc/self/fd")
+    try:
+        for fd in fd_dir.iterdir():
+            try:
+                if str(fd.readlink()).startswith("socket:"):
+                    count += 1
+            except OSError:
+                continue
+    except OSError:
+        return -1
+    return count
+
+
+class Sampler:
+    """
+    Collect periodic resource samples in bounded storage.
+
+    Only the first and the latest SAMPLE_WINDOW samples are kept, so the
+    sampler's own memory does not grow with the length of the run and is not
+    mistaken for a leak.
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty sample series."""
+        self.first: list[dict] = []
+        self.latest: deque[dict] = deque(maxlen=SAMPLE_WINDOW)
+        self.count = 0
+        self._started = time.monotonic()
+
+    def sample(
+        self, progress: dict, coordinator: CenturionGarageDataUpdateCoordinator
+    ) -> None:
+        """Record one sample of every tracked resource."""
+        traced, _ = tracemalloc.get_traced_memory()
+        api_client = coordinator.api_client
+        sample = {
+            "elapsed": round(time.monotonic() - self._started, 3),
+            "polls": progress["polls"],
+            "streams": progress["streams"],
+            "camera_subscribers": api_client.metrics.stream_subscribers,
+            "relay_viewers": api_client.camera_relay.viewers,
+            "rss": _rss_bytes(),
+            "sockets": _open_sockets(),
+            "tasks": len(asyncio.all_tasks()),
+            "traced": traced,
+        }
+        if len(self.first) < SAMPLE_WINDOW:
+            self.first.append(sample)
+        self.latest.append(sample)
+        self.count += 1
+
+    def growth(self, key: str) -> int:
+        """
+        Return the median growth of key between the start and end of the run.
+
+        Compares the first and last SAMPLE_WINDOW samples, or the first and
+        last quarter of the samples in shorter runs.
+
+        """
+        window = min(SAMPLE_WINDOW, self.count // 4)
+        if not window:
+            return 0
+        head = [sample[key] for sample in self.first[:window]]
+        tail = [sample[key] for sample in list(self.latest)[-window:]]
+        return int(statistics.median(tail) - statistics.median(head))
+
+
+class SoakApiClient(CenturionGarageApiClient):
+    """API client whose rate limits and camera stream suit the soak run."""
+
+    def __init__(
+        self, host: str, session: aiohttp.ClientSession, time_scale: float
+    ) -> None:
+        """Initialize the client with every token bucket sped up by time_scale."""
+        super().__init__(host, API_KEY, session)
+        self.scheduler = CenturionGarageRequestScheduler(
+            rate_limits={
+                priority: (rate * time_scale, burst)
+                for priority, (rate, burst) in REQUEST_RATE_LIMITS.items()
+            }
+        )
+
+    @property
+    def camera_url(self) -> str:
+        """Return the fake controller stream URL."""
+        return f"http://{self.ip_address}/stream"
+
+
+async def _run_polls(
+    camera: CenturionGarageCamera,
+    controller: FakeController,
+    arp_table: Path,
+    polls: int,
+    progress: dict,
+) -> None:
+    """Refresh the coordinator, interleaving faults, commands and snapshots."""
+    coordinator = camera.coordinator
+    client = coordinator.api_client
+    for index in range(1, polls + 1):
+        if index % MOVE_EVERY == 0:
+            _write_arp_table(arp_table, controller.move())
+        elif index % FAIL_EVERY == 0:
+            controller.fail_next = True
+        bound = client.ip_address
+        await coordinator.async_refresh()
+        if client.ip_address != bound:
+            progress["rebinds"] += 1
+        if not coordinator.last_update_success:
+            progress["failed_polls"] += 1
+        elif "door" not in coordinator.data:
+            msg = f"Unexpected status payload: {coordinator.data}"
+            raise RuntimeError(msg)
+        if index % COMMAND_EVERY == 0:
+            await (client.lamp_on() if index % 2 else client.lamp_off())
+            await client.open_door()
+        if index % SNAPSHOT_EVERY == 0 and await camera.async_camera_image() is None:
+            msg = "Camera snapshot failed"
+            raise RuntimeError(msg)
+        progress["polls"] = index
+
+
+def _camera_proxy(camera: CenturionGarageCamera) -> web.Application:
+    """Return an app serving the camera MJPEG handler like HA's proxy view."""
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        response = await camera.handle_async_mjpeg_stream(request)
+        if response is None:
+            raise web.HTTPBadGateway
+        return response
+
+    app = web.Application()
+    app.router.add_get("/camera", handle)
+    return app
+
+
+async def _run_viewer(
+    session: aiohttp.ClientSession, url: str, streams: int, progress: dict
+) -> None:
+    """Connect to the camera proxy, read a few frames and disconnect."""
+    marker = f"--{BOUNDARY}".encode()
+    for _ in range(streams):
+        async with session.get(url) as response:
+            response.raise_for_status()
+            frames = 0
+            async for line in response.content:
+                if line.startswith(marker):
+                    frames += 1
+                    if frames > FRAMES_PER_STREAM:
+                        break
+        progress["streams"] += 1
+
+
+async def _async_settle(api_client: CenturionGarageApiClient) -> list[str]:
+    """Wait for the camera to release every viewer and the upstream stream."""
+    deadline = time.monotonic() + SETTLE_TIMEOUT
+    while time.monotonic() < deadline:
+        if (
+            api_client.metrics.stream_subscribers == 0
+            and api_client.camera_relay.viewers == 0
+            and not api_client.camera_relay.connected
+        ):
+            return []
+        await asyncio.sleep(0.1)
+    leaks = []
+    if api_client.metrics.stream_subscribers:
+        leaks.append("camera_subscribers")
+    if api_client.camera_relay.viewers:
+        leaks.append("relay_viewers")
+    if api_client.camera_relay.connected:
+        leaks.append("upstream_stream")
+    return leaks
+
+
+async def _sample_loop(
+    sampler: Sampler,
+    progress: dict,
+    coordinator: CenturionGarageDataUpdateCoordinator,
+    interval: float,
+    done: asyncio.Event,
+) -> None:
+    """Sample resources until the run completes."""
+    while not done.is_set():
+        sampler.sample(progress, coordinator)
+        try:
+            await asyncio.wait_for(done.wait(), interval)
+        except TimeoutError:
+            continue
+    sampler.sample(progress, coordinator)
+
+
+async def _async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start a bare Home Assistant instance to host the coordinator."""
+    hass = HomeAssistant(config_dir)
+    hass.config_entries = ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    # Loads the adapters that the shared client session's resolver needs.
+    await network.async_get_adapters(hass)
+    await hass.async_start()
+    return hass
+
+
+def _add_config_entry(hass: HomeAssistant, host: str) -> ConfigEntry:
+    """Register a config entry for the fake controller without setting it up."""
+    entry = ConfigEntry(
+        data={CONF_IP_ADDRESS: host, CONF_API_KEY: API_KEY, CONF_MAC: MAC},
+        discovery_keys=MappingProxyType({}),
+        domain=DOMAIN,
+        minor_version=1,
+        options={},
+        source=SOURCE_USER,
+        subentries_data=None,
+        title="Soak",
+        unique_id=MAC,
+        version=1,
+    )
+    hass.config_entries._entries[entry.entry_id] = entry  # noqa: SLF001
+    return entry
+
+
+def _expected_faults(polls: int) -> tuple[int, int]:
+    """Return the failed polls and rebinds a run of polls should produce."""
+    # MOVE_EVERY is a multiple of FAIL_EVERY and a move replaces the fault.
+    moves = polls // MOVE_EVERY
+    return polls // FAIL_EVERY - moves, moves
+
+
+async def async_soak(args: argparse.Namespace, config_dir: Path) -> dict:  # noqa: PLR0915
+    """Run the soak test and return the report."""
+    hass = await _async_start_hass(str(config_dir))
+    viewer_session = aiohttp.ClientSession()
+    runners = []
+
+    async def serve(app: web.Application, count: int = 1) -> list[int]:
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        runners.append(runner)
+        ports = []
+        for _ in range(count):
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            ports.append(site._server.sockets[0].getsockname()[1])  # noqa: SLF001
+        return ports
+
+    controller = FakeController()
+    controller.ports = await serve(controller.application(), count=2)
+    controller.port = controller.ports[0]
+    arp_table = config_dir / "arp"
+    _write_arp_table(arp_table, controller.host)
+    discovery.ARP_TABLE_PATH = arp_table
+
+    entry = _add_config_entry(hass, controller.host)
+    coordinator = CenturionGarageDataUpdateCoordinator(
+        hass=hass,
+        config_entry=entry,
+        api_client=SoakApiClient(
+            controller.host, async_get_clientsession(hass), args.time_scale
+        ),
+        logger=LOGGER,
+        update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL / args.time_scale),
+    )
+    api_client = coordinator.api_client
+    camera = CenturionGarageCamera(coordinator)
+    (proxy_port,) = await serve(_camera_proxy(camera))
+    camera_url = f"http://127.0.0.1:{proxy_port}/camera"
+
+    tracemalloc.start(args.traceback_depth)
+    own_frames = [
+        tracemalloc.Filter(inclusive=False, filename_pattern=__file__),
+        tracemalloc.Filter(inclusive=False, filename_pattern=tracemalloc.__file__),
+    ]
+    sampler = Sampler()
+    progress = {"polls": 0, "streams": 0, "failed_polls": 0, "rebinds": 0}
+    done = asyncio.Event()
+    sampling = None
+
+    try:
+        await _run_polls(camera, controller, arp_table, args.warmup_polls, {**progress})
+        baseline = tracemalloc.take_snapshot().filter_traces(own_frames)
+        started = time.monotonic()
+        sampling = asyncio.create_task(
+            _sample_loop(sampler, progress, coordinator, args.sample_interval, done)
+        )
+        viewers = max(1, args.viewers)
+        await asyncio.gather(
+            _run_polls(camera, controller, arp_table, args.polls, progress),
+            *(
+                _run_viewer(
+                    viewer_session,
+                    camera_url,
+                    args.streams // viewers + (index < args.streams % viewers),
+                    progress,
+                )
+                for index in range(viewers)
+            ),
+        )
+        elapsed = time.monotonic() - started
+        leaks = await _async_settle(api_client)
+        errors = dict(api_client.metrics.errors)
+        bound_to = entry.data[CONF_IP_ADDRESS]
+    finally:
+        done.set()
+        if sampling is not None:
+            await sampling
+        api_client.camera_relay.stop()
+        await viewer_session.close()
+        for runner in runners:
+            await runner.cleanup()
+        await hass.async_stop()
+
+    final = tracemalloc.take_snapshot().filter_traces(own_frames)
+    tracemalloc.stop()
+    top = final.compare_to(baseline, "lineno")[: args.top]
+
+    checks = {
+        "rss": (sampler.growth("rss"), RSS_TOLERANCE),
+        "traced": (sampler.growth("traced"), TRACED_TOLERANCE),
+        "sockets": (sampler.growth("sockets"), SOCKET_TOLERANCE),
+        "tasks": (sampler.growth("tasks"), TASK_TOLERANCE),
+    }
+    failures = [
+        name for name, (growth, tolerance) in checks.items() if growth > tolerance
+    ]
+    failures.extend(leaks)
+    expected_failed_polls, expected_rebinds = _expected_faults(args.polls)
+    if progress["failed_polls"] != expected_failed_polls:
+        failures.append("failed_polls")
+    if progress["rebinds"] != expected_rebinds:
+        failures.append("rebinds")
+    if bound_to != controller.host or api_client.ip_address != controller.host:
+        failures.append("bound_address")
+    return {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "arguments": {**vars(args), "report": str(args.report)},
+        "elapsed": round(elapsed, 3),
+        "polls": progress["polls"],
+        "streams": progress["streams"],
+        "controller_requests": controller.requests,
+        "polls_per_second": round(progress["polls"] / elapsed, 1),
+        "coordinator": {
+            "failed_polls": progress["failed_polls"],
+            "expected_failed_polls": expected_failed_polls,
+            "rebinds": progress["rebinds"],
+            "expected_rebinds": expected_rebinds,
+            "recent_update_intervals": list(api_client.metrics.update_intervals),
+            "recent_poll_timings": list(api_client.metrics.poll_timings),
+            "discovery_hits": coordinator.discovery.cache.hits,
+            "discovery_misses": coordinator.discovery.cache.misses,
+        },
+        "errors": errors,
+        "leaks": leaks,
+        "growth": {
+            name: {"growth": growth, "tolerance": tolerance}
+            for name, (growth, tolerance) in checks.items()
+        },
+        "top_allocators": [
+            {
+                "location": str(stat.traceback),
+                "size_diff": stat.size_diff,
+                "count_diff": stat.count_diff,
+            }
+            for stat in top
+        ],
+        "samples": {
+            "count": sampler.count,
+            "first": sampler.first,
+            "latest": list(sampler.latest),
+        },
+        "failures": failures,
+        "passed": not failures,
+    }
+
+
+def main() -> int:
+    """Parse arguments, run the soak test and write the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--polls", type=int, default=1_000_000)
+    parser.add_argument("--streams", type=int, default=5_000)
+    parser.add_argument("--viewers", type=int, default=3)
+    parser.add_argument("--time-scale", type=float, default=250.0)
+    parser.add_argument("--warmup-polls", type=int, default=1_000)
+    parser.add_argument("--sample-interval", type=float, default=1.0)
+    parser.add_argument("--traceback-depth", type=int, default=1)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--report", type=Path, default=Path("soak_report.json"))
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    # Injected failures would otherwise log an error on every occurrence.
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        report = asyncio.run(async_soak(args, Path(config_dir)))
+    args.report.write_text(json.dumps(report, indent=2, default=str))
+
+    lines = [
+        f"{report['polls']} polls and {report['streams']} stream connects in "
+        f"{report['elapsed']}s ({report['polls_per_second']} polls/s)",
+        f"  failed polls: {report['coordinator']['failed_polls']} "
+        f"(expected {report['coordinator']['expected_failed_polls']}), "
+        f"rebinds: {report['coordinator']['rebinds']} "
+        f"(expected {report['coordinator']['expected_rebinds']})",
+        *(
+            f"  {name}: +{check['growth']} (limit {check['tolerance']})"
+            for name, check in report["growth"].items()
+        ),
+        f"Report written to {args.report}",
+    ]
+    if report["failures"]:
+        lines.append(f"FAILED: {', '.join(report['failures'])}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())